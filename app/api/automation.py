@@ -14,6 +14,7 @@ Updated: 2026-02-26 - Wired to UnifiedPipeline (replaces simplified_flow RSS-onl
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from typing import Dict, Any
 import logging
+import traceback
 from datetime import datetime
 
 # Local imports
@@ -112,7 +113,6 @@ async def _run_complete_pipeline_background(user: dict, db: SupabaseConnection):
 
     except Exception as e:
         logger.error("❌ UnifiedPipeline background task failed: %s", e)
-        import traceback
         logger.error(traceback.format_exc())
 
 @router.get("/status", response_model=Dict[str, Any])
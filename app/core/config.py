@@ -146,6 +146,12 @@ class Settings(BaseSettings):
         default=30, description="HTTP request timeout in seconds"
     )
 
+    thread_pool_size: int = Field(
+        default=32,
+        ge=1,
+        description="Worker threads for content extraction's blocking page fetches and parsing",
+    )
+
     # Database Configuration
     max_database_connections: int = Field(
         default=10, description="Maximum database connection pool size"
@@ -207,7 +207,62 @@ class SupabaseConnection:
                 "success": False,
                 "error": f"Database upsert failed: {str(e)}"
             }
-    
+
+    async def upsert_current_affairs_bulk(self, articles: List[Dict[str, Any]], match_field: str = "url") -> Dict[str, Any]:
+        """
+        Insert or update many current affair articles in a single request
+
+        Args:
+            articles: List of article data dictionaries (same keys in every row)
+            match_field: Field to match for existing records
+
+        Returns:
+            Dict: Upsert result with success status and number of rows written
+        """
+        if not articles:
+            return {"success": True, "data": [], "count": 0, "message": "No articles to upsert"}
+
+        try:
+            # Add metadata (one timestamp for the whole batch)
+            now = datetime.now(timezone.utc).isoformat()
+            for article_data in articles:
+                article_data["updated_at"] = now
+                if "created_at" not in article_data:
+                    article_data["created_at"] = now
+
+            # PostgREST upserts a JSON array in one POST (merge-duplicates on conflict)
+            result = self.client.table("current_affairs").upsert(
+                articles,
+                on_conflict=match_field
+            ).execute()
+
+            if result.data:
+                logger.info(f"Successfully bulk upserted {len(result.data)} articles")
+                return {
+                    "success": True,
+                    "data": result.data,
+                    "count": len(result.data),
+                    "message": "Articles upserted successfully"
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": "No data returned from bulk upsert operation"
+                }
+
+        except APIError as e:
+            logger.error(f"API error bulk upserting current affairs: {e}")
+            return {
+                "success": False,
+                "error": f"Database API error: {e.message if hasattr(e, 'message') else str(e)}"
+            }
+        except Exception as e:
+            logger.error(f"Failed to bulk upsert current affairs: {e}")
+            return {
+                "success": False,
+                "error": f"Database bulk upsert failed: {str(e)}"
+            }
+
     async def insert_current_affair(self, article_data: Dict[str, Any]) -> bool:
         """
         Insert a current affairs article with duplicate detection
@@ -36,7 +36,14 @@ class IDSAScraper:
     LISTING_URL = "https://idsa.in/comment-briefs/"
     BASE_URL = "https://idsa.in"
 
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self._client = client
+
     async def _http_get(self, url: str) -> httpx.Response:
+        if self._client is not None:
+            resp = await self._client.get(url, headers=_HEADERS)
+            resp.raise_for_status()
+            return resp
         async with httpx.AsyncClient(
             headers=_HEADERS, follow_redirects=True, timeout=30.0
         ) as client:
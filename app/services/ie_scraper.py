@@ -39,8 +39,9 @@ class IndianExpressScraper:
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Safari/605.1.15",
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
         self.rate_limit_delay: float = 1.5  # seconds between section requests
+        self._client = client
 
     def _get_headers(self) -> Dict[str, str]:
         """Return request headers with a random User-Agent."""
@@ -184,9 +185,15 @@ class IndianExpressScraper:
             return []
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, headers=self._get_headers())
-                response.raise_for_status()
+            if self._client is not None:
+                # The shared client follows redirects; this scraper never has
+                response = await self._client.get(
+                    url, headers=self._get_headers(), follow_redirects=False
+                )
+            else:
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    response = await client.get(url, headers=self._get_headers())
+            response.raise_for_status()
 
             articles = self._parse_articles(response.text, section_name)
             logger.info(
@@ -30,6 +30,9 @@ class MEAScraper:
     # MEA date formats seen on the listing page: "February 23, 2026"
     DATE_FORMAT = "%B %d, %Y"
 
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self._client = client
+
     def _get_headers(self) -> dict[str, str]:
         return {
             "User-Agent": random.choice(USER_AGENTS),
@@ -41,6 +44,8 @@ class MEAScraper:
 
     async def _http_get(self, url: str) -> httpx.Response:
         """Mockable HTTP GET — single entry point for all network calls."""
+        if self._client is not None:
+            return await self._client.get(url, headers=self._get_headers())
         async with httpx.AsyncClient(
             headers=self._get_headers(), timeout=30.0, follow_redirects=True
         ) as client:
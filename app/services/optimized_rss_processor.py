@@ -23,6 +23,7 @@ import hashlib
 from urllib.parse import urlparse
 import time
 import re
+import traceback
 
 # Async HTTP and RSS processing
 import httpx
@@ -198,8 +199,9 @@ class OptimizedRSSProcessor:
                         articles.append(article)
 
                 # Update source health metrics
-                source.last_fetch_time = datetime.now(timezone.utc)
-                source.last_success_time = datetime.now(timezone.utc)
+                fetched_at = datetime.now(timezone.utc)
+                source.last_fetch_time = fetched_at
+                source.last_success_time = fetched_at
                 source.consecutive_failures = 0
                 source.health_score = min(100.0, source.health_score + 5.0)
 
@@ -709,6 +711,8 @@ Return only the JSON response, no other text."""
             # Step 1: Enhanced data preparation with validation
             articles_for_db = []
             existing_hashes = set()
+            # One timestamp for the whole batch instead of two clock reads per article
+            now_iso = datetime.now(timezone.utc).isoformat()
 
             for idx, article in enumerate(articles):
                 try:
@@ -758,8 +762,8 @@ Return only the JSON response, no other text."""
                             else None,
                             "content_hash": article.content_hash,
                             "status": "published",
-                            "created_at": datetime.now(timezone.utc).isoformat(),
-                            "updated_at": datetime.now(timezone.utc).isoformat(),
+                            "created_at": now_iso,
+                            "updated_at": now_iso,
                         }
 
                         # Additional validation
@@ -854,8 +858,6 @@ Return only the JSON response, no other text."""
         except Exception as e:
             logger.error(f"❌ CRITICAL: Unexpected error in bulk database save: {e}")
             logger.error(f"❌ Error type: {type(e).__name__}")
-            import traceback
-
             logger.error(f"❌ Traceback: {traceback.format_exc()}")
             error_count += 1
 
@@ -37,6 +37,9 @@ class ORFScraper:
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
     ]
 
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self._client = client
+
     def _get_headers(self) -> dict[str, str]:
         import random
 
@@ -49,6 +52,8 @@ class ORFScraper:
         }
 
     async def _http_get(self, url: str) -> httpx.Response:
+        if self._client is not None:
+            return await self._client.get(url, headers=self._get_headers())
         async with httpx.AsyncClient(
             headers=self._get_headers(), timeout=30.0, follow_redirects=True
         ) as client:
@@ -69,8 +69,9 @@ class PIBScraper:
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
         self.rate_limit_delay: float = 1.5  # seconds between requests
+        self._client = client
 
     def _get_headers(self) -> Dict[str, str]:
         """Return request headers with a random User-Agent."""
@@ -225,6 +226,8 @@ class PIBScraper:
         Returns:
             httpx.Response object.
         """
+        if self._client is not None:
+            return await self._client.get(url, headers=self._get_headers())
         async with httpx.AsyncClient(
             headers=self._get_headers(), timeout=30.0, follow_redirects=True
         ) as client:
@@ -240,6 +243,8 @@ class PIBScraper:
         Returns:
             httpx.Response object.
         """
+        if self._client is not None:
+            return await self._client.post(url, data=data, headers=self._get_headers())
         async with httpx.AsyncClient(
             headers=self._get_headers(), timeout=30.0, follow_redirects=True
         ) as client:
@@ -43,6 +43,8 @@ class PlaywrightSessionManager:
         # In-memory cache of storage-state dicts keyed by site to avoid
         # repeated DB reads within the same pipeline run.
         self._cookie_cache: Dict[str, Optional[dict]] = {}
+        # One session may serve several scrapers concurrently; only launch once.
+        self._browser_lock = asyncio.Lock()
 
     # ------------------------------------------------------------------
     # Supabase cookie persistence
@@ -148,10 +150,13 @@ class PlaywrightSessionManager:
     async def _ensure_browser(self) -> None:
         if self._browser is not None:
             return
-        pw = await async_playwright().start()
-        self._playwright = pw
-        self._browser = await pw.chromium.launch(headless=True)
-        logger.info("[PlaywrightSession] Browser launched (headless)")
+        async with self._browser_lock:
+            if self._browser is not None:
+                return
+            pw = await async_playwright().start()
+            self._playwright = pw
+            self._browser = await pw.chromium.launch(headless=True)
+            logger.info("[PlaywrightSession] Browser launched (headless)")
 
     async def _random_delay(self) -> None:
         delay = random.uniform(2.0, 5.0)
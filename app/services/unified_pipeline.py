@@ -1,8 +1,15 @@
 import asyncio
+import functools
 import hashlib
 import logging
+import re
+import sys
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+import httpx
 
 from app.services.optimized_rss_processor import OptimizedRSSProcessor
 from app.services.ie_scraper import IndianExpressScraper
@@ -26,6 +33,18 @@ logger = logging.getLogger(__name__)
 # Pipeline configuration
 # NOTE: RELEVANCE_THRESHOLD = 55 lives in KnowledgeCardPipeline (knowledge_card_pipeline.py)
 _MAX_ARTICLES_DEFAULT = 30
+_MAX_AGE_HOURS = 36
+# Concurrent URL extractions; each one also holds a worker thread for the blocking fetch
+_EXTRACTION_CONCURRENCY = 16
+# Global socket cap for the shared scraper client (httpx has no per-host limit).
+# Scrapers take it as ``client=`` and never close it; without one they open a
+# short-lived client per request.
+_HTTP_LIMITS = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+
+# UPSC prep/coaching round-ups (not real current affairs)
+_PREP_ARTICLE_RE = re.compile(
+    r'(?i)UPSC\s+(Key|Essentials|Weekly|Prelims\s*Ready|Quiz|Simplified)'
+)
 
 
 _HINDU_SOURCE_TO_SECTION: dict[str, str] = {
@@ -39,7 +58,9 @@ _HINDU_SOURCE_TO_SECTION: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def _derive_section(source_name: str) -> str:
+    # Only a handful of distinct feed names exist, so nearly every call is a cache hit
     lower = source_name.lower()
     for keyword, section in _HINDU_SOURCE_TO_SECTION.items():
         if keyword in lower:
@@ -56,131 +77,252 @@ def _normalize_hindu_article(article: dict[str, Any]) -> dict[str, Any]:
 
 
 
-def _normalize_httpx_article(article: dict[str, Any]) -> dict[str, Any]:
-    """Normalize httpx scraper output: copy source_url -> url for dedup."""
-    if "url" not in article and "source_url" in article:
-        article["url"] = article["source_url"]
-    return article
-
-
-def _deduplicate(articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    seen: set[str] = set()
+def _normalize_httpx_articles(articles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Normalize httpx scraper output in place: copy source_url -> url for dedup."""
+    for article in articles:
+        if "source_url" in article:
+            article.setdefault("url", article["source_url"])
+    return articles
+
+
+# Query params that only record where a click came from; any other param is kept
+# because some sources (e.g. PIB's ?PRID=) identify the article by query string.
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "ref", "ref_src", "cmpid"})
+
+
+def _url_key(url: str) -> str:
+    """Dedup key for a URL: lowercased host + path without trailing slash,
+    scheme and fragment dropped, tracking query params stripped."""
+    # Most feed URLs are already lowercase; skip the copy for those
+    parts = urlsplit(url if url.islower() else url.lower())
+    key = parts.netloc + parts.path.rstrip("/")
+    if parts.query:
+        query = "&".join(
+            param
+            for param in parts.query.split("&")
+            if param
+            and not param.startswith("utm_")
+            and param.partition("=")[0] not in _TRACKING_PARAMS
+        )
+        if query:
+            key = f"{key}?{query}"
+    return key
+
+
+def _deduplicate(
+    articles: list[dict[str, Any]], seen: set[str] | None = None, warn: bool = True
+) -> list[dict[str, Any]]:
+    """Drop articles whose URL key is already in ``seen`` (updated in place),
+    so batches can be deduplicated incrementally against each other.
+    ``warn=False`` skips the no-URL warning for a pass that another pass repeats."""
+    if seen is None:
+        seen = set()
+    seen_add = seen.add
     unique: list[dict[str, Any]] = []
+    unique_append = unique.append
     for article in articles:
-        url_key = article.get("url", "").lower()
-        if not url_key:
-            logger.warning(
-                "Skipping article with no URL: '%s'",
-                article.get("title", "unknown"),
-            )
+        url = article.get("url", "")
+        if not url:
+            if warn:
+                logger.warning(
+                    "Skipping article with no URL: '%s'",
+                    article.get("title", "unknown"),
+                )
             continue
+        # Interned keys let repeat URLs (same story across feeds) match by identity
+        url_key = sys.intern(_url_key(url))
         if url_key in seen:
             continue
-        seen.add(url_key)
-        unique.append(article)
+        seen_add(url_key)
+        unique_append(article)
     return unique
 
 
 
 
-def _filter_by_date(articles: list[dict[str, Any]], max_age_hours: int = 36) -> list[dict[str, Any]]:
-    """Remove articles older than max_age_hours. Articles with no date are kept (with warning)."""
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-    filtered = []
-    for article in articles:
-        pub_date = article.get("published_date") or article.get("published_at")
-        if not pub_date:
-            logger.warning("Article has no date, keeping with today's date: '%s'", article.get('title', 'unknown'))
-            article['published_date'] = datetime.now(timezone.utc).isoformat()
-            filtered.append(article)
-            continue
-        try:
-            if isinstance(pub_date, str):
-                parsed = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
-            elif isinstance(pub_date, datetime):
-                parsed = pub_date if pub_date.tzinfo else pub_date.replace(tzinfo=timezone.utc)
-            else:
-                filtered.append(article)
-                continue
-            if parsed >= cutoff:
-                filtered.append(article)
-            else:
-                logger.debug("Date-filtered: '%s' (published %s)", article.get('title', 'unknown'), pub_date)
-        except (ValueError, TypeError):
-            filtered.append(article)  # Keep on parse error
-    return filtered
+def _passes_date(article: dict[str, Any], cutoff: datetime) -> bool:
+    """True if the article is newer than cutoff. Articles with no date pass (with warning)."""
+    pub_date = article.get("published_date") or article.get("published_at")
+    if not pub_date:
+        logger.warning("Article has no date, keeping with today's date: '%s'", article.get('title', 'unknown'))
+        article['published_date'] = datetime.now(timezone.utc).isoformat()
+        return True
+    try:
+        if isinstance(pub_date, str):
+            parsed = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
+        elif isinstance(pub_date, datetime):
+            parsed = pub_date if pub_date.tzinfo else pub_date.replace(tzinfo=timezone.utc)
+        else:
+            return True
+        if parsed >= cutoff:
+            return True
+        logger.debug("Date-filtered: '%s' (published %s)", article.get('title', 'unknown'), pub_date)
+        return False
+    except (ValueError, TypeError):
+        return True  # Keep on parse error
 
-def _parse_date(published_date: Any) -> str:
-    """Parse published_date to YYYY-MM-DD string; fallback to today."""
-    if not published_date:
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if isinstance(published_date, datetime):
-        return published_date.strftime("%Y-%m-%d")
-    s = str(published_date).strip()
-    # Already YYYY-MM-DD
+
+@functools.lru_cache(maxsize=1)
+def _today_str(hour_bucket: int) -> str:
+    # Keyed on the UTC hour so the date is formatted at most once an hour; hour
+    # buckets align with UTC midnight, so the cached date never goes stale
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _today() -> str:
+    return _today_str(int(time.time()) // 3600)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_date_str(s: str) -> str:
+    """YYYY-MM-DD for a date string, or "" if unparseable (cached: feeds repeat dates)."""
+    s = s.strip()
+    # Already YYYY-MM-DD (after stripping whitespace)
     if len(s) >= 10 and s[4] == "-" and s[7] == "-":
         return s[:10]
     # Try ISO parse
     try:
         return datetime.fromisoformat(s.replace("Z", "+00:00")).strftime("%Y-%m-%d")
     except (ValueError, TypeError):
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        return ""
+
+
+def _parse_date(published_date: Any) -> str:
+    """Parse published_date to YYYY-MM-DD string; fallback to today."""
+    # datetime first: it is what the RSS and scraper parsers hand us most often
+    if isinstance(published_date, datetime):
+        return published_date.strftime("%Y-%m-%d")
+    if not published_date:
+        return _today()
+    if isinstance(published_date, str):
+        # Already YYYY-MM-DD: slice without allocating a stripped copy
+        if len(published_date) >= 10 and published_date[4] == "-" and published_date[7] == "-":
+            return published_date[:10]
+        parsed = _parse_date_str(published_date)
+    else:
+        parsed = _parse_date_str(str(published_date))
+    # "" is cached for bad input, so today is resolved per call, never cached
+    return parsed or _today()
+
+
+_TRIAGE_TO_IMPORTANCE = {"must_know": "high", "should_know": "medium", "good_to_know": "low"}
 
 
 def _triage_to_importance(triage: str) -> str:
     """Map priority_triage to importance: must_know->high, should_know->medium, else->low."""
-    mapping = {"must_know": "high", "should_know": "medium", "good_to_know": "low"}
-    return mapping.get(triage, "low")
+    return _TRIAGE_TO_IMPORTANCE.get(triage, "low")
 
 
+@functools.singledispatch
 def _to_iso_str(value: Any) -> str:
     """Convert a datetime object or ISO string to an ISO string; fallback to empty string."""
-    if isinstance(value, datetime):
-        return value.isoformat()
-    if isinstance(value, str):
-        return value
     return ""
 
+
+@_to_iso_str.register
+def _(value: datetime) -> str:
+    return value.isoformat()
+
+
+@_to_iso_str.register
+def _(value: str) -> str:
+    return value
+
+
+def _content_hash(content: str) -> str:
+    # surrogatepass: scraped text can carry lone surrogates, which strict UTF-8 rejects
+    return hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
 def prepare_knowledge_card_for_database(article: dict[str, Any]) -> dict[str, Any]:
     """Map enriched article dict to DB row with all 5-layer fields populated."""
-    syllabus_matches = article.get("syllabus_matches") or []
+    get = article.get
+    syllabus_matches = get("syllabus_matches") or []
     syllabus_topic = syllabus_matches[0].get("sub_topic", "") if syllabus_matches else ""
+    content = get("content", "")
+    source_site = get("source_site", "")
+    published_date = get("published_date")
+    priority_triage = get("priority_triage", "good_to_know")
 
+    # Empty []/{} defaults stay per-row literals: a shared sentinel would alias across rows
     return {
         # Core fields
-        "title": article.get("title", ""),
-        "content": article.get("content", ""),
-        "source_url": article.get("url", ""),
-        "source_site": article.get("source_site", ""),
-        "source": article.get("source_site", ""),
-        "published_at": _to_iso_str(article.get("published_date")) or datetime.now(timezone.utc).isoformat(),
-        "date": _parse_date(article.get("published_date")),
+        "title": get("title", ""),
+        "content": content,
+        "source_url": get("url", ""),
+        "source_site": source_site,
+        "source": source_site,
+        "published_at": _to_iso_str(published_date) or datetime.now(timezone.utc).isoformat(),
+        "date": _parse_date(published_date),
         "status": "published",
         # Analysis fields
-        "upsc_relevance": article.get("upsc_relevance", 0),
-        "gs_paper": article.get("gs_paper", ""),
-        "tags": article.get("keywords") or [],
-        "category": article.get("category") or "general",
-        "importance": _triage_to_importance(article.get("priority_triage", "good_to_know")),
+        "upsc_relevance": get("upsc_relevance", 0),
+        "gs_paper": get("gs_paper", ""),
+        "tags": get("keywords") or [],
+        "category": get("category") or "general",
+        "importance": _triage_to_importance(priority_triage),
         # 5-layer knowledge card fields
-        "headline_layer": article.get("headline_layer", ""),
-        "facts_layer": article.get("facts_layer") or [],
-        "context_layer": article.get("context_layer", ""),
-        "connections_layer": article.get("connections_layer") or {},
-        "mains_angle_layer": article.get("mains_angle_layer", ""),
-        "practice_questions_layer": article.get("practice_questions_layer") or [],
-        "priority_triage": article.get("priority_triage", "good_to_know"),
+        "headline_layer": get("headline_layer", ""),
+        "facts_layer": get("facts_layer") or [],
+        "context_layer": get("context_layer", ""),
+        "connections_layer": get("connections_layer") or {},
+        "mains_angle_layer": get("mains_angle_layer", ""),
+        "practice_questions_layer": get("practice_questions_layer") or [],
+        "priority_triage": priority_triage,
         "syllabus_topic": syllabus_topic,
         # Deduplication
-        "summary": article.get("summary") or article.get("extracted_summary", ""),
-        "key_vocabulary": article.get("key_vocabulary") or [],
-        "content_hash": hashlib.md5(article.get("content", "").encode()).hexdigest(),
+        "summary": get("summary") or get("extracted_summary", ""),
+        "key_vocabulary": get("key_vocabulary") or [],
+        "content_hash": _content_hash(content),
     }
 
 
+def _prepare_rows(
+    articles: list[dict[str, Any]],
+) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    """Build (article, db_row) pairs; articles whose row can't be built are logged and dropped."""
+    prepared: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    for article in articles:
+        try:
+            prepared.append((article, prepare_knowledge_card_for_database(article)))
+        except Exception as e:
+            logger.error("Failed to save '%s': %s", article.get("title", "unknown"), e)
+    return prepared
+
+
 class UnifiedPipeline:
-    async def fetch_all_sources(self) -> list[dict[str, Any]]:
-        all_articles: list[dict[str, Any]] = []
+    def __init__(self) -> None:
+        # Built on first use and reused for every later call on this instance
+        self._knowledge_card_pipeline: KnowledgeCardPipeline | None = None
+        self._content_extractor: UniversalContentExtractor | None = None
+
+    def _get_knowledge_card_pipeline(self) -> KnowledgeCardPipeline:
+        if self._knowledge_card_pipeline is None:
+            self._knowledge_card_pipeline = KnowledgeCardPipeline()
+        return self._knowledge_card_pipeline
+
+    def _get_content_extractor(self) -> UniversalContentExtractor:
+        if self._content_extractor is None:
+            self._content_extractor = UniversalContentExtractor()
+        return self._content_extractor
+
+    async def fetch_all_sources(
+        self,
+        on_batch: Callable[[list[dict[str, Any]]], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch and dedup every source.
+
+        ``on_batch`` sees each source's articles, minus URLs an earlier-finishing
+        source already delivered, as soon as that source finishes. The returned
+        list resolves duplicates by source order (the order of ``tasks``), so it
+        is the same whichever source finishes first; an article streamed to
+        ``on_batch`` can lose to a later-finishing, higher-priority copy.
+        """
+        # One pooled client for every httpx scraper: sources mostly hit a few
+        # hosts, so TCP/TLS connections are reused instead of re-handshaked
+        http_client = httpx.AsyncClient(
+            timeout=30.0, follow_redirects=True, limits=_HTTP_LIMITS
+        )
 
         async def _fetch_hindu() -> list[dict[str, Any]]:
             processor = OptimizedRSSProcessor()
@@ -188,47 +330,42 @@ class UnifiedPipeline:
             return [_normalize_hindu_article(a) for a in raw]
 
         async def _fetch_ie() -> list[dict[str, Any]]:
-            scraper = IndianExpressScraper()
+            scraper = IndianExpressScraper(client=http_client)
             return await scraper.scrape_all_sections()
 
         async def _fetch_pib() -> list[dict[str, Any]]:
-            scraper = PIBScraper()
+            scraper = PIBScraper(client=http_client)
             return await scraper.scrape_releases()
 
         async def _fetch_supplementary() -> list[dict[str, Any]]:
             sources = SupplementarySources()
             return await asyncio.to_thread(sources.fetch_all)
 
+        # One browser serves both paywalled scrapers (separate per-site contexts)
+        pw_session = PlaywrightSessionManager()
+
         async def _fetch_hindu_playwright() -> list[dict[str, Any]]:
-            session = PlaywrightSessionManager()
-            scraper = HinduPlaywrightScraper(session)
-            try:
-                return await scraper.scrape_editorials()
-            finally:
-                await session.close()
+            scraper = HinduPlaywrightScraper(pw_session)
+            return await scraper.scrape_editorials()
 
         async def _fetch_ie_playwright() -> list[dict[str, Any]]:
-            session = PlaywrightSessionManager()
-            scraper = IEPlaywrightScraper(session)
-            try:
-                return await scraper.scrape_editorials()
-            finally:
-                await session.close()
+            scraper = IEPlaywrightScraper(pw_session)
+            return await scraper.scrape_editorials()
 
         async def _fetch_mea() -> list[dict[str, Any]]:
-            scraper = MEAScraper()
+            scraper = MEAScraper(client=http_client)
             articles = await scraper.fetch_articles()
-            return [_normalize_httpx_article(a) for a in articles]
+            return _normalize_httpx_articles(articles)
 
         async def _fetch_orf() -> list[dict[str, Any]]:
-            scraper = ORFScraper()
+            scraper = ORFScraper(client=http_client)
             articles = await scraper.fetch_articles()
-            return [_normalize_httpx_article(a) for a in articles]
+            return _normalize_httpx_articles(articles)
 
         async def _fetch_idsa() -> list[dict[str, Any]]:
-            scraper = IDSAScraper()
+            scraper = IDSAScraper(client=http_client)
             articles = await scraper.fetch_articles()
-            return [_normalize_httpx_article(a) for a in articles]
+            return _normalize_httpx_articles(articles)
 
         tasks = {
             "hindu": _fetch_hindu(),
@@ -242,68 +379,146 @@ class UnifiedPipeline:
             "idsa": _fetch_idsa(),
         }
 
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        async def _named(source_name: str, coro: Any) -> tuple[str, Any]:
+            try:
+                return source_name, await coro
+            except Exception as e:
+                return source_name, e
 
-        for source_name, result in zip(tasks.keys(), results):
-            if isinstance(result, Exception):
-                logger.error("Source '%s' failed: %s", source_name, result)
-                continue
-            count = len(result) if isinstance(result, list) else 0
-            logger.info("Source '%s' returned %d articles", source_name, count)
-            if isinstance(result, list):
-                all_articles.extend(result)
+        # Hand each source's batch on as it lands so fast sources aren't held
+        # behind the slow Playwright scrapers
+        streamed_seen: set[str] = set()
+        results: dict[str, list[dict[str, Any]]] = {}
+        fetches = [asyncio.create_task(_named(name, coro)) for name, coro in tasks.items()]
+        try:
+            for next_done in asyncio.as_completed(fetches):
+                source_name, result = await next_done
+                if isinstance(result, Exception):
+                    logger.error("Source '%s' failed: %s", source_name, result)
+                    continue
+                count = len(result) if isinstance(result, list) else 0
+                logger.info("Source '%s' returned %d articles", source_name, count)
+                if isinstance(result, list):
+                    results[source_name] = result
+                    if on_batch is not None:
+                        # The source-order pass below reports URL-less articles
+                        on_batch(_deduplicate(result, streamed_seen, warn=False))
+        finally:
+            # Stop any fetch still running before the client and browser it uses close
+            for fetch in fetches:
+                fetch.cancel()
+            await asyncio.gather(*fetches, return_exceptions=True)
+            await pw_session.close()
+            await http_client.aclose()
+
+        # Final dedup in source order, independent of completion order
+        seen: set[str] = set()
+        deduped: list[dict[str, Any]] = []
+        raw_count = 0
+        for source_name in tasks:
+            batch = results.get(source_name)
+            if batch:
+                raw_count += len(batch)
+                deduped.extend(_deduplicate(batch, seen))
 
-        deduped = _deduplicate(all_articles)
         logger.info(
             "Total articles: %d raw → %d after dedup",
-            len(all_articles),
+            raw_count,
             len(deduped),
         )
         return deduped
 
     async def enrich_articles(
-        self, articles: list[dict[str, Any]]
+        self, articles: list[dict[str, Any]], concurrency: int = 8
     ) -> list[dict[str, Any]]:
         # DEPRECATED: Used by tests only. New flow uses run() directly.
         if not articles:
             return []
 
-        pipeline = KnowledgeCardPipeline()
-        enriched: list[dict[str, Any]] = []
+        pipeline = self._get_knowledge_card_pipeline()
+        # Cap in-flight LLM calls so a large batch doesn't trip provider rate limits
+        semaphore = asyncio.Semaphore(concurrency)
 
-        for article in articles:
-            try:
-                result = await pipeline.process_article(article)
-                if result is not None:
-                    enriched.append(result)
-            except Exception as e:
-                logger.error(
-                    "process_article failed for '%s': %s",
-                    article.get("title", "unknown"),
-                    e,
-                )
+        async def _enrich_one(article: dict[str, Any]) -> dict[str, Any] | None:
+            async with semaphore:
+                try:
+                    return await pipeline.process_article(article)
+                except Exception as e:
+                    logger.error(
+                        "process_article failed for '%s': %s",
+                        article.get("title", "unknown"),
+                        e,
+                    )
+                    return None
 
-        return enriched
+        results = await asyncio.gather(*(_enrich_one(a) for a in articles))
+        return [result for result in results if result is not None]
 
     async def save_articles(
         self,
         articles: list[dict[str, Any]],
         db: SupabaseConnection,
     ) -> dict[str, Any]:
-        """Save enriched articles to DB via upsert. Never raises; accumulates counts."""
+        """Save enriched articles to DB via upsert. Never raises; accumulates counts.
+
+        All rows go out in one bulk upsert; if that fails, each row is retried
+        individually, one at a time, so one bad row doesn't lose the whole batch.
+        """
         saved = 0
         skipped = 0
         errors = 0
 
+        to_save: list[dict[str, Any]] = []
         for article in articles:
+            if not (article.get("content") or "").strip():
+                # Would hash to the empty-string digest and collide with every other empty row
+                skipped += 1
+                logger.warning(
+                    "Skipping save of '%s': empty content", article.get("title", "unknown")
+                )
+                continue
+            to_save.append(article)
+
+        # Hashing full article bodies is CPU work; keep it off the event loop
+        prepared = await asyncio.to_thread(_prepare_rows, to_save)
+        errors += len(to_save) - len(prepared)
+
+        if not prepared:
+            return {"saved": saved, "skipped": skipped, "errors": errors}
+
+        try:
+            bulk = await db.upsert_current_affairs_bulk(
+                [db_row for _, db_row in prepared], match_field="source_url"
+            )
+        except Exception as e:
+            bulk = {"success": False, "error": str(e)}
+
+        if bulk.get("success"):
+            saved += len(prepared)
+            if logger.isEnabledFor(logging.DEBUG):
+                for article, _ in prepared:
+                    logger.debug(
+                        "Saved: '%s' [%s]",
+                        article.get("title", "unknown"),
+                        article.get("priority_triage", "unknown"),
+                    )
+            logger.info("Saved %d articles (skipped=%d errors=%d)", saved, skipped, errors)
+            return {"saved": saved, "skipped": skipped, "errors": errors}
+
+        logger.warning(
+            "Bulk upsert of %d articles failed (%s); falling back to per-row upserts",
+            len(prepared),
+            bulk.get("error", "unknown"),
+        )
+        # Serial on purpose: the Supabase client is synchronous, so upserts can't
+        # overlap on the event loop; this path only runs after a bulk failure
+        for article, db_row in prepared:
             title = article.get("title", "unknown")
-            triage = article.get("priority_triage", "unknown")
             try:
-                db_row = prepare_knowledge_card_for_database(article)
                 result = await db.upsert_current_affair(db_row, match_field="source_url")
                 if result.get("success"):
                     saved += 1
-                    logger.info("Saved: '%s' [%s]", title, triage)
+                    logger.debug("Saved: '%s' [%s]", title, article.get("priority_triage", "unknown"))
                 else:
                     errors += 1
                     logger.error(
@@ -312,56 +527,92 @@ class UnifiedPipeline:
             except Exception as e:
                 errors += 1
                 logger.error("Failed to save '%s': %s", title, e)
+        logger.info("Saved %d articles (skipped=%d errors=%d)", saved, skipped, errors)
 
         return {"saved": saved, "skipped": skipped, "errors": errors}
 
     async def run(self, max_articles: int = 30, save_to_db: bool = False) -> dict[str, Any]:
-        # Step 1: Fetch all sources (existing — already includes URL dedup)
-        raw_articles = await self.fetch_all_sources()
-        # Step 2: Date filter (NEW — remove articles > 36h old)
-        date_filtered = _filter_by_date(raw_articles)
-        logger.info("Date filter: %d → %d articles", len(raw_articles), len(date_filtered))
-
-        # Step 2b: Filter UPSC prep/coaching articles (not real current affairs)
-        import re as _re
-        _prep_pattern = _re.compile(
-            r'(?i)UPSC\s+(Key|Essentials|Weekly|Prelims\s*Ready|Quiz|Simplified)'
-        )
-        date_filtered = [
-            a for a in date_filtered
-            if not _prep_pattern.search(a.get('title', ''))
-        ]
-        logger.info("Prep-article filter: kept %d articles", len(date_filtered))
-
-        # Step 3: Content extraction (on ALL date-filtered articles, no blind cap)
-        extractor = UniversalContentExtractor()
-        articles_with_content: list[dict[str, Any]] = []
-        for article in date_filtered:
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=_MAX_AGE_HOURS)
+        # Step 3 is set up before Step 1: content extraction on ALL date-filtered
+        # articles (no blind cap) starts per source batch as it lands, overlapping
+        # the slower scrapers that are still fetching.
+        extractor = self._get_content_extractor()
+        semaphore = asyncio.Semaphore(_EXTRACTION_CONCURRENCY)
+
+        async def _with_content(article: dict[str, Any]) -> dict[str, Any] | None:
             article['rss_snippet'] = article.get('content', '')
             if article.get('content') and '<p>' in article.get('content', ''):
-                articles_with_content.append(article)
-                continue
+                return article
             url = article.get('url', '')
             if not url:
                 logger.warning("Skipping article without URL or content: '%s'", article.get('title', 'unknown'))
-                continue
+                return None
             try:
-                extracted = await extractor.extract_content(url)
+                async with semaphore:
+                    extracted = await extractor.extract_content(url)
                 if extracted is None or not extracted.content:
                     logger.warning("Content extraction returned empty for '%s'", article.get('title', 'unknown'))
-                    if article.get('rss_snippet'):
-                        articles_with_content.append(article)
-                    continue
+                    return article if article.get('rss_snippet') else None
                 article['content'] = extracted.content
                 article['extracted_summary'] = extracted.summary or ''
-                articles_with_content.append(article)
+                return article
             except Exception as e:
                 logger.error("Content extraction failed for '%s': %s", article.get('title', 'unknown'), e)
                 if article.get('rss_snippet'):
                     article['content'] = article['rss_snippet']
-                    articles_with_content.append(article)
+                    return article
+                return None
+
+        extraction_tasks: dict[int, asyncio.Task] = {}
+        # Streamed articles already judged by the filters, so Step 2 doesn't re-run them
+        date_rejected: set[int] = set()
+        prep_rejected: set[int] = set()
+
+        def _start_extraction(batch: list[dict[str, Any]]) -> None:
+            for article in batch:
+                if not _passes_date(article, cutoff):
+                    date_rejected.add(id(article))
+                elif _PREP_ARTICLE_RE.search(article.get('title', '')):
+                    prep_rejected.add(id(article))
+                else:
+                    extraction_tasks[id(article)] = asyncio.create_task(_with_content(article))
+
+        # Step 1: Fetch all sources (existing — already includes URL dedup)
+        try:
+            raw_articles = await self.fetch_all_sources(on_batch=_start_extraction)
+        except BaseException:
+            for task in extraction_tasks.values():
+                task.cancel()
+            raise
+        # A streamed article can lose the final dedup to a higher-priority copy
+        kept_ids = {id(a) for a in raw_articles}
+        for article_id in [k for k in extraction_tasks if k not in kept_ids]:
+            extraction_tasks.pop(article_id).cancel()
+        # Step 2 + 2b: Date filter (> 36h old) and UPSC prep/coaching filter, in one pass
+        date_filtered: list[dict[str, Any]] = []
+        date_dropped = 0
+        for article in raw_articles:
+            article_id = id(article)
+            if article_id in extraction_tasks:
+                date_filtered.append(article)
+            elif article_id in date_rejected:
+                date_dropped += 1
+            elif article_id in prep_rejected:
+                continue
+            elif not _passes_date(article, cutoff):
+                date_dropped += 1
+            elif not _PREP_ARTICLE_RE.search(article.get('title', '')):
+                date_filtered.append(article)
+        logger.info("Date filter: %d → %d articles", len(raw_articles), len(raw_articles) - date_dropped)
+        logger.info("Prep-article filter: kept %d articles", len(date_filtered))
+
+        # Step 3: Wait for extractions (start any that weren't streamed, e.g. a stubbed fetch)
+        extracted_results = await asyncio.gather(
+            *(extraction_tasks.get(id(a)) or _with_content(a) for a in date_filtered)
+        )
+        articles_with_content = [a for a in extracted_results if a is not None]
         # Step 4: Batch scoring via run_pass1_batch() (NEW)
-        pipeline = KnowledgeCardPipeline()
+        pipeline = self._get_knowledge_card_pipeline()
         pass1_results = await pipeline.run_pass1_batch(articles_with_content)
 
         # Merge pass1 results back into article dicts (keyed by URL)
@@ -18,6 +18,9 @@ logging.basicConfig(
 
 logger = logging.getLogger("pipeline_test")
 
+# Marker the knowledge-card pipeline wraps around Drishti-style key terms
+KEY_TERM_MARKER = '<span class="key-term"'
+
 
 async def main():
     from app.services.unified_pipeline import UnifiedPipeline
@@ -26,43 +29,50 @@ async def main():
     logger.info("FULL PIPELINE TEST — save_to_db=False (dry run)")
     logger.info("=" * 70)
 
-    start = time.time()
+    start = time.perf_counter()
     pipeline = UnifiedPipeline()
     result = await pipeline.run(save_to_db=False)
-    elapsed = round(time.time() - start, 2)
+    elapsed = round(time.perf_counter() - start, 2)
 
     # ---- Summary ----
-    logger.info("=" * 70)
-    logger.info("PIPELINE FINISHED in %.2f seconds", elapsed)
-    logger.info("  Total fetched   : %d", result.get("total_fetched", 0))
-    logger.info("  Total enriched  : %d", result.get("total_enriched", 0))
-    logger.info("  Filtered out    : %d", result.get("filtered", 0))
-    logger.info("  Pass1 scored    : %d", result.get("pass1_count", 0))
-    logger.info("  Pass2 cards     : %d", result.get("pass2_count", 0))
-    logger.info("  GS distribution : %s", result.get("gs_distribution", {}))
-    logger.info("  LLM calls       : %d", result.get("llm_calls", 0))
-    logger.info("=" * 70)
+    logger.info(
+        "\n".join(
+            [
+                "=" * 70,
+                f"PIPELINE FINISHED in {elapsed:.2f} seconds",
+                f"  Total fetched   : {result.get('total_fetched', 0)}",
+                f"  Total enriched  : {result.get('total_enriched', 0)}",
+                f"  Filtered out    : {result.get('filtered', 0)}",
+                f"  Pass1 scored    : {result.get('pass1_count', 0)}",
+                f"  Pass2 cards     : {result.get('pass2_count', 0)}",
+                f"  GS distribution : {result.get('gs_distribution', {})}",
+                f"  LLM calls       : {result.get('llm_calls', 0)}",
+                "=" * 70,
+            ]
+        )
+    )
 
     # ---- Per-article detail ----
     articles = result.get("articles", [])
-    for i, a in enumerate(articles, 1):
-        title = a.get("title", "???")
-        content = a.get("content", "")
-        summary = a.get("summary", "")
-        has_key_term = '<span class="key-term"' in content if content else False
-        content_len = len(content) if content else 0
-        logger.info(
-            "[%d/%d] %s  | content=%d chars | key-terms=%s | summary=%d chars | gs=%s | relevance=%s | triage=%s",
-            i,
-            len(articles),
-            title[:80],
-            content_len,
-            has_key_term,
-            len(summary) if summary else 0,
-            a.get("gs_paper", "?"),
-            a.get("upsc_relevance", "?"),
-            a.get("priority_triage", "?"),
-        )
+    n = len(articles)
+    # Skip building the per-article lines at all if INFO is filtered out
+    if logger.isEnabledFor(logging.INFO):
+        for i, a in enumerate(articles, 1):
+            title = a.get("title") or "???"
+            content = a.get("content") or ""
+            summary = a.get("summary") or ""
+            logger.info(
+                "[%d/%d] %s  | content=%d chars | key-terms=%s | summary=%d chars | gs=%s | relevance=%s | triage=%s",
+                i,
+                n,
+                title[:80],
+                len(content),
+                KEY_TERM_MARKER in content,
+                len(summary),
+                a.get("gs_paper", "?"),
+                a.get("upsc_relevance", "?"),
+                a.get("priority_triage", "?"),
+            )
 
     # ---- Spot-check: print first article's content snippet ----
     if articles:
@@ -13,13 +13,17 @@ Usage:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import re
+import secrets
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 # Load env vars from parent directory (.env in project root)
 from dotenv import load_dotenv
@@ -47,7 +51,22 @@ VPS_HOST = "ubuntu@15.235.187.137"
 DB_USER = "supabase_admin"
 DB_NAME = "postgres"
 SSH_OPTS = ["-o", "ConnectTimeout=10", "-o", "StrictHostKeyChecking=no",
-            "-o", "ServerAliveInterval=15", "-o", "ServerAliveCountMax=3"]
+            "-o", "ServerAliveInterval=15", "-o", "ServerAliveCountMax=3",
+            # Multiplex every ssh/scp call over one connection instead of a
+            # fresh TCP + key exchange per call; closed by close_ssh_master()
+            "-o", "ControlMaster=auto", "-o", "ControlPath=/tmp/bf-%C",
+            "-o", "ControlPersist=60s"]
+
+# Concurrent content extractions (each holds a worker thread for the HTTP fetch)
+EXTRACT_CONCURRENCY = 8
+
+# Extracted bodies whose 64-bit simhashes differ in at most this many bits are
+# reported as the same story (e.g. wire-service reprints); each row is still
+# updated, since every stub needs its full content
+NEAR_DUP_MAX_BITS = 3
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"\w+")
 
 
 def ssh_cmd(remote_cmd: str, timeout: int = 30) -> subprocess.CompletedProcess:
@@ -56,6 +75,12 @@ def ssh_cmd(remote_cmd: str, timeout: int = 30) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
 
 
+def close_ssh_master() -> None:
+    """Shut down the shared SSH control connection, if one is open."""
+    cmd = ["ssh"] + SSH_OPTS + ["-O", "exit", VPS_HOST]
+    subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+
+
 def scp_to_vps(local_path: str, remote_path: str, timeout: int = 30) -> None:
     """Copy a file to the VPS via SCP."""
     cmd = ["scp"] + SSH_OPTS + [local_path, f"{VPS_HOST}:{remote_path}"]
@@ -78,7 +103,11 @@ def run_sql(query: str, timeout: int = 30) -> str:
 
 
 def run_sql_json(query: str, timeout: int = 30) -> list[dict]:
-    """Run SQL query and return results as list of dicts (JSON output)."""
+    """Run SQL query and return results as list of dicts (JSON output).
+
+    Postgres aggregates the whole result into one JSON value, so keep this for
+    small queries; use run_sql_rows for anything that may return many rows.
+    """
     json_query = f"SELECT json_agg(t) FROM ({query}) t"
     remote_cmd = (
         f'docker exec supabase-db psql -U {DB_USER} -d {DB_NAME} '
@@ -93,6 +122,32 @@ def run_sql_json(query: str, timeout: int = 30) -> list[dict]:
     return json.loads(output)
 
 
+def run_sql_rows(query: str, columns: list[str], timeout: int = 30) -> list[dict]:
+    """Run SQL query and return results as list of dicts (unaligned psql output).
+
+    Rows come back as plain fields separated by NUL bytes (-z) and records
+    separated by NUL bytes too (-0), so Postgres never builds a json_agg document
+    and titles with tabs or newlines cannot split a row. Use run_sql_json only
+    for small result sets that need JSON types.
+    """
+    remote_cmd = (
+        f'docker exec supabase-db psql -U {DB_USER} -d {DB_NAME} '
+        f'-t -A -z -0 -c "{query}"'
+    )
+    result = ssh_cmd(remote_cmd, timeout=timeout)
+    if result.returncode != 0:
+        raise RuntimeError(f"SQL failed: {result.stderr}")
+    # Only the final record separator; trailing NULs before it are empty fields
+    output = result.stdout.removesuffix("\0")
+    if not output:
+        return []
+    fields = output.split("\0")
+    n = len(columns)
+    if len(fields) % n:
+        raise RuntimeError(f"SQL output has {len(fields)} fields, not a multiple of {n} columns")
+    return [dict(zip(columns, fields[i:i + n])) for i in range(0, len(fields), n)]
+
+
 def run_sql_file(sql_content: str, timeout: int = 60) -> str:
     """Write SQL to a temp file, SCP to VPS, docker cp into container, execute."""
     vps_tmp = "/tmp/backfill_update.sql"
@@ -117,7 +172,8 @@ def run_sql_file(sql_content: str, timeout: int = 60) -> str:
 
         # Execute inside the container
         result = ssh_cmd(
-            f'docker exec supabase-db psql -U {DB_USER} -d {DB_NAME} -f {container_tmp}',
+            f'docker exec supabase-db psql -U {DB_USER} -d {DB_NAME} '
+            f'-v ON_ERROR_STOP=1 -f {container_tmp}',
             timeout=timeout,
         )
         if result.returncode != 0:
@@ -132,33 +188,83 @@ def run_sql_file(sql_content: str, timeout: int = 60) -> str:
         os.unlink(local_tmp)
 
 
-def update_article(article_id: str, content: str, summary: str | None) -> bool:
-    """Update article content via SQL file (handles large content safely)."""
+def dollar_quote(text: str) -> str:
+    """Dollar-quote text for SQL with a random tag that will not occur in it."""
+    # Dollar-quoting avoids escaping issues with HTML content; a 64-bit random
+    # tag makes a collision negligible without scanning the text for it
+    tag = f"$BF_{secrets.token_hex(8)}$"
+    return f"{tag}{text}{tag}"
+
+
+def build_update_sql(article_id: str, content: str, summary: str | None) -> str:
+    """UPDATE statement for one article's content (and summary, if usable)."""
+    if summary and len(summary) > 10:
+        return (
+            f"UPDATE current_affairs\n"
+            f"SET content = {dollar_quote(content)},\n"
+            f"    summary = {dollar_quote(summary)}\n"
+            f"WHERE id = '{article_id}';\n"
+        )
+    return (
+        f"UPDATE current_affairs\n"
+        f"SET content = {dollar_quote(content)}\n"
+        f"WHERE id = '{article_id}';\n"
+    )
+
+
+def csv_field(value: str | None) -> str:
+    """Quote a value for COPY ... (FORMAT csv); None becomes an unquoted NULL."""
+    if value is None:
+        return ""
+    return '"' + value.replace('"', '""') + '"'
+
+
+def build_copy_update_sql(updates: list[tuple[str, str, str | None]]) -> str | None:
+    """COPY all rows into a temp table, then apply them with one UPDATE ... FROM.
+
+    Returns None if a value contains a line that is just \\. (psql would read it
+    as the end of the inline COPY data).
+    """
+    rows = []
+    for article_id, content, summary in updates:
+        summary = summary if summary and len(summary) > 10 else None
+        for text in (content, summary):
+            if text and "\\." in text.splitlines():
+                return None
+        rows.append(f"{article_id},{csv_field(content)},{csv_field(summary)}\n")
+
+    return (
+        "CREATE TEMP TABLE _bf (id uuid, content text, summary text) ON COMMIT DROP;\n"
+        "COPY _bf (id, content, summary) FROM STDIN WITH (FORMAT csv);\n"
+        + "".join(rows)
+        + "\\.\n"
+        "UPDATE current_affairs c\n"
+        "SET content = b.content,\n"
+        "    summary = COALESCE(b.summary, c.summary)\n"
+        "FROM _bf b\n"
+        "WHERE c.id = b.id;\n"
+    )
+
+
+def update_articles(updates: list[tuple[str, str, str | None]]) -> bool:
+    """Apply all (id, content, summary) updates in one transaction via one SQL file.
+
+    Rows are streamed in with COPY and applied by a single set-based UPDATE, so
+    Postgres plans one statement instead of one per article. ON_ERROR_STOP makes
+    a bad row roll the whole batch back rather than half-applying it.
+    """
+    body = build_copy_update_sql(updates)
+    if body is None:
+        # Fall back to one UPDATE per row (still a single file and transaction)
+        body = "".join(
+            build_update_sql(article_id, content, summary)
+            for article_id, content, summary in updates
+        )
     try:
-        # Use dollar-quoting to avoid escaping issues with HTML content
-        # Choose a unique dollar-tag unlikely to appear in content
-        dollar_tag = "$BACKFILL$"
-        if dollar_tag in content:
-            dollar_tag = "$BF2$"
-        if summary and len(summary) > 10:
-            if dollar_tag in summary:
-                dollar_tag = "$BF3$"
-            sql = (
-                f"UPDATE current_affairs\n"
-                f"SET content = {dollar_tag}{content}{dollar_tag},\n"
-                f"    summary = {dollar_tag}{summary}{dollar_tag}\n"
-                f"WHERE id = '{article_id}';\n"
-            )
-        else:
-            sql = (
-                f"UPDATE current_affairs\n"
-                f"SET content = {dollar_tag}{content}{dollar_tag}\n"
-                f"WHERE id = '{article_id}';\n"
-            )
-        run_sql_file(sql, timeout=60)
+        run_sql_file("BEGIN;\n" + body + "COMMIT;\n", timeout=300)
         return True
     except Exception as e:
-        logger.error(f"  FAIL: DB update error: {e}")
+        logger.error(f"  FAIL: DB batch update error: {e}")
         return False
 
 
@@ -170,7 +276,103 @@ def fetch_stub_articles() -> list[dict]:
         "WHERE date = '2026-02-25' AND LENGTH(content) < 500 "
         "ORDER BY LENGTH(content) ASC"
     )
-    return run_sql_json(query, timeout=30)
+    rows = run_sql_rows(query, ["id", "title", "source_url", "content_len"], timeout=30)
+    for row in rows:
+        row["content_len"] = int(row["content_len"] or 0)
+    return rows
+
+
+def canonical_url(url: str) -> str:
+    """Canonical form of a URL for grouping duplicates (host case, query order, fragment)."""
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+def group_stubs_by_url(stubs: list[dict]) -> list[list[dict]]:
+    """Group stubs that share a canonical source_url, keeping first-seen order.
+
+    Stubs without a source_url stay in groups of their own.
+    """
+    groups: dict[str, list[dict]] = {}
+    singles: list[list[dict]] = []
+    for article in stubs:
+        source_url = article.get("source_url")
+        if not source_url:
+            singles.append([article])
+            continue
+        groups.setdefault(canonical_url(source_url), []).append(article)
+    return list(groups.values()) + singles
+
+
+def simhash(html: str) -> int:
+    """64-bit simhash of the words in an HTML body (tags ignored)."""
+    weights = [0] * 64
+    for word in set(_WORD_RE.findall(_TAG_RE.sub(" ", html).lower())):
+        h = int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, w in enumerate(weights) if w > 0)
+
+
+def is_near_duplicate(fingerprint: int, seen: list[int]) -> bool:
+    """True if fingerprint is within NEAR_DUP_MAX_BITS of any fingerprint in seen."""
+    return any((fingerprint ^ other).bit_count() <= NEAR_DUP_MAX_BITS for other in seen)
+
+
+async def extract_stub(
+    extractor: UniversalContentExtractor,
+    article: dict,
+    label: str,
+    semaphore: asyncio.Semaphore,
+) -> tuple[str, str | None, str | None]:
+    """Extract and validate one stub article.
+
+    Returns (status, content, summary) where status is "ok", "skipped" or "failed".
+    """
+    title = (article.get("title") or "???")[:80]
+    source_url = article.get("source_url") or ""
+    old_len = article.get("content_len") or 0
+
+    if not source_url:
+        logger.warning(f"{label} SKIP: No source_url ({title})")
+        return "skipped", None, None
+
+    try:
+        async with semaphore:
+            extracted = await extractor.extract_content(source_url)
+    except Exception as e:
+        logger.error(f"{label} FAIL: Extraction exception for {source_url}: {e}")
+        return "failed", None, None
+
+    if not extracted:
+        logger.warning(f"{label} SKIP: Extraction returned None (paywall/403/418): {source_url}")
+        return "skipped", None, None
+
+    new_content = extracted.content
+    new_summary = extracted.summary
+
+    # Validate: must have <p> tags AND length > 200 AND longer than original
+    has_p_tags = "<p>" in new_content
+    is_long_enough = len(new_content) > 200
+    is_improvement = len(new_content) > old_len
+
+    if not has_p_tags or not is_long_enough:
+        logger.warning(
+            f"{label} SKIP: Extracted content too short or no <p> tags "
+            f"(len={len(new_content)}, has_p={has_p_tags})"
+        )
+        return "skipped", None, None
+
+    if not is_improvement:
+        logger.warning(
+            f"{label} SKIP: New content not longer than existing "
+            f"(new={len(new_content)}, old={old_len})"
+        )
+        return "skipped", None, None
+
+    logger.info(f"{label} Extracted {old_len} -> {len(new_content)} chars: {title}")
+    return "ok", new_content, new_summary
 
 
 async def backfill() -> None:
@@ -192,65 +394,56 @@ async def backfill() -> None:
     skipped = 0
     failed = 0
 
-    for i, article in enumerate(stubs, 1):
-        article_id = str(article["id"])
-        title = (article.get("title") or "???")[:80]
-        source_url = article.get("source_url") or ""
-        old_len = article.get("content_len") or 0
-
-        logger.info(f"\n[{i}/{len(stubs)}] {title}")
-        logger.info(f"  URL: {source_url}")
-        logger.info(f"  Current content length: {old_len}")
-
-        if not source_url:
-            logger.warning("  SKIP: No source_url")
-            skipped += 1
-            continue
-
-        try:
-            extracted = await extractor.extract_content(source_url)
-        except Exception as e:
-            logger.error(f"  FAIL: Extraction exception: {e}")
-            failed += 1
-            continue
-
-        if not extracted:
-            logger.warning("  SKIP: Extraction returned None (paywall/403/418)")
-            skipped += 1
-            continue
-
-        new_content = extracted.content
-        new_summary = extracted.summary
-
-        # Validate: must have <p> tags AND length > 200 AND longer than original
-        has_p_tags = "<p>" in new_content
-        is_long_enough = len(new_content) > 200
-        is_improvement = len(new_content) > old_len
-
-        if not has_p_tags or not is_long_enough:
-            logger.warning(
-                f"  SKIP: Extracted content too short or no <p> tags "
-                f"(len={len(new_content)}, has_p={has_p_tags})"
+    # Re-ingested duplicates share a source URL; extract each URL once. The
+    # longest existing stub in a group stands in for it, so the "longer than
+    # existing" check holds for every article the result is applied to.
+    groups = group_stubs_by_url(stubs)
+    if len(groups) < len(stubs):
+        logger.info(f"{len(stubs) - len(groups)} stubs share a source URL; extracting {len(groups)} URLs")
+
+    # Extractions are independent network fetches; run a bounded number at once
+    semaphore = asyncio.Semaphore(EXTRACT_CONCURRENCY)
+    results = await asyncio.gather(
+        *(
+            extract_stub(
+                extractor,
+                max(group, key=lambda a: a.get("content_len") or 0),
+                f"[{i}/{len(groups)}]",
+                semaphore,
             )
-            skipped += 1
-            continue
+            for i, group in enumerate(groups, 1)
+        ),
+        return_exceptions=True,
+    )
 
-        if not is_improvement:
-            logger.warning(
-                f"  SKIP: New content not longer than existing "
-                f"(new={len(new_content)}, old={old_len})"
-            )
-            skipped += 1
+    updates: list[tuple[str, str, str | None]] = []
+    fingerprints: list[int] = []
+    near_duplicate_ids: list[str] = []
+    for group, result in zip(groups, results):
+        if isinstance(result, Exception):
+            logger.error(f"  FAIL: {group[0].get('source_url')}: {result}")
+            failed += len(group)
             continue
-
-        if update_article(article_id, new_content, new_summary):
-            updated += 1
-            logger.info(
-                f"  UPDATED: {old_len} -> {len(new_content)} chars "
-                f"(summary={'yes' if new_summary and len(new_summary) > 10 else 'no'})"
-            )
+        status, new_content, new_summary = result
+        if status == "skipped":
+            skipped += len(group)
+        elif status == "failed":
+            failed += len(group)
+        else:
+            fingerprint = simhash(new_content)
+            if is_near_duplicate(fingerprint, fingerprints):
+                logger.warning(f"  NEAR-DUP: Content matches another article extracted this run: {group[0].get('source_url')}")
+                near_duplicate_ids.extend(str(article["id"]) for article in group)
+            else:
+                fingerprints.append(fingerprint)
+            updates.extend((str(article["id"]), new_content, new_summary) for article in group)
+
+    if updates:
+        logger.info(f"Writing {len(updates)} updates in one transaction")
+        if update_articles(updates):
+            updated += len(updates)
         else:
-            failed += 1
+            failed += len(updates)
 
     logger.info("\n" + "=" * 60)
     logger.info("BACKFILL COMPLETE")
@@ -258,8 +451,14 @@ async def backfill() -> None:
     logger.info(f"  Skipped: {skipped}")
     logger.info(f"  Failed:  {failed}")
     logger.info(f"  Total:   {len(stubs)}")
+    if near_duplicate_ids:
+        logger.info(f"  Near-duplicate content (updated, review for reprints): {len(near_duplicate_ids)}")
+        logger.info(f"    ids: {', '.join(near_duplicate_ids)}")
     logger.info("=" * 60)
 
 
 if __name__ == "__main__":
-    asyncio.run(backfill())
+    try:
+        asyncio.run(backfill())
+    finally:
+        close_ssh_master()
@@ -0,0 +1,108 @@
+"""
+Unit tests for scripts/backfill_feb25_content.py.
+
+Covers: simhash fingerprints, near-duplicate detection, and that near-duplicate
+extractions are still written to every stub row.
+
+No SSH/psql or network calls — the DB helpers and extractor are mocked.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "backfill_feb25_content.py"
+
+
+@pytest.fixture(scope="module")
+def backfill():
+    """Load the backfill script as a module (it is not part of a package)."""
+    spec = importlib.util.spec_from_file_location("backfill_feb25_content", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _body(words):
+    return "<p>" + " ".join(words) + "</p>"
+
+
+_STORY = [f"word{i}" for i in range(300)]
+
+
+# ---------------------------------------------------------------------------
+# simhash / is_near_duplicate
+# ---------------------------------------------------------------------------
+
+
+class TestSimhash:
+    def test_identical_bodies_hash_equal(self, backfill):
+        assert backfill.simhash(_body(_STORY)) == backfill.simhash(_body(_STORY))
+
+    def test_markup_and_case_ignored(self, backfill):
+        plain = backfill.simhash(_body(_STORY))
+        marked_up = backfill.simhash(
+            "<div class='story'>" + " ".join(w.upper() for w in _STORY) + "</div>"
+        )
+        assert plain == marked_up
+
+    def test_fits_in_64_bits(self, backfill):
+        assert 0 <= backfill.simhash(_body(_STORY)) < 2**64
+
+
+class TestIsNearDuplicate:
+    def test_small_edit_is_near_duplicate(self, backfill):
+        original = backfill.simhash(_body(_STORY))
+        edited = backfill.simhash(_body(["reprint"] + _STORY[1:]))
+        assert backfill.is_near_duplicate(edited, [original])
+
+    def test_different_story_is_not_near_duplicate(self, backfill):
+        original = backfill.simhash(_body(_STORY))
+        other = backfill.simhash(_body([f"other{i}" for i in range(300)]))
+        assert not backfill.is_near_duplicate(other, [original])
+
+    def test_threshold_is_inclusive(self, backfill):
+        bits = backfill.NEAR_DUP_MAX_BITS
+        within = (1 << bits) - 1  # exactly NEAR_DUP_MAX_BITS bits differ from 0
+        beyond = (1 << (bits + 1)) - 1
+        assert backfill.is_near_duplicate(within, [0])
+        assert not backfill.is_near_duplicate(beyond, [0])
+
+    def test_empty_seen_is_not_near_duplicate(self, backfill):
+        assert not backfill.is_near_duplicate(backfill.simhash(_body(_STORY)), [])
+
+
+# ---------------------------------------------------------------------------
+# backfill(): near-duplicates are reported, not skipped
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_stub_is_still_updated(backfill):
+    stubs = [
+        {"id": "id-1", "title": "A", "source_url": "https://a.com/1", "content_len": 50},
+        {"id": "id-2", "title": "B", "source_url": "https://b.com/2", "content_len": 50},
+    ]
+    bodies = {
+        "https://a.com/1": _body(_STORY),
+        "https://b.com/2": _body(["reprint"] + _STORY[1:]),
+    }
+
+    async def extract(url):
+        return MagicMock(content=bodies[url], summary="A summary of the story.")
+
+    extractor = MagicMock()
+    extractor.extract_content = AsyncMock(side_effect=extract)
+    update_articles = MagicMock(return_value=True)
+
+    with (
+        patch.object(backfill, "fetch_stub_articles", return_value=stubs),
+        patch.object(backfill, "UniversalContentExtractor", return_value=extractor),
+        patch.object(backfill, "update_articles", update_articles),
+    ):
+        await backfill.backfill()
+
+    updated_ids = [article_id for article_id, _, _ in update_articles.call_args.args[0]]
+    assert updated_ids == ["id-1", "id-2"]
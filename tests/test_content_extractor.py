@@ -33,14 +33,13 @@ def extractor():
 
 
 @patch(f"{_P}.trafilatura")
-@patch(f"{_P}.requests")
-async def test_trafilatura_returns_html(mock_requests, mock_traf, extractor):
+async def test_trafilatura_returns_html(mock_traf, extractor):
     """trafilatura extraction should return sanitized HTML containing <p> tags."""
-    # Mock requests.get (used by _extract_with_trafilatura)
+    # Mock the pooled session's get (used by _extract_with_trafilatura)
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.text = "<html><body><p>Raw page</p></body></html>"
-    mock_requests.get.return_value = mock_response
+    extractor._session.get = MagicMock(return_value=mock_response)
 
     # Mock trafilatura.extract to return HTML content
     mock_traf.extract.return_value = "<p>Extracted content paragraph.</p>"
@@ -62,6 +61,25 @@ async def test_trafilatura_returns_html(mock_requests, mock_traf, extractor):
     assert "<p>" in result.content
 
 
+def test_page_fetches_share_one_pooled_session(extractor):
+    """Every strategy fetches through one session carrying browser headers."""
+    from requests.adapters import HTTPAdapter
+
+    assert "Mozilla" in extractor._session.headers["User-Agent"]
+    adapter = extractor._session.get_adapter("https://www.thehindu.com/")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 32
+
+
+async def test_blocking_calls_run_on_extraction_pool(extractor):
+    """Blocking fetches use the extractor's own pool, not the loop's default executor."""
+    import threading
+
+    thread_name = await extractor._run_blocking(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("content-extractor")
+
+
 # ---------------------------------------------------------------------------
 # Test 2: _sanitize_html removes <script> tags
 # ---------------------------------------------------------------------------
@@ -129,9 +147,11 @@ async def test_newspaper_wraps_text_in_p_tags(
     mock_article.canonical_link = ""
     mock_article.meta_lang = "en"
 
-    # asyncio.to_thread should call _newspaper3k_extract synchronously
+    # The thread-pool hop should call _newspaper3k_extract synchronously
     # and return the mock article
-    mock_asyncio.to_thread = AsyncMock(return_value=mock_article)
+    mock_asyncio.get_running_loop.return_value.run_in_executor = AsyncMock(
+        return_value=mock_article
+    )
 
     result = await extractor._extract_with_newspaper3k("https://example.com/news")
 
@@ -7,7 +7,7 @@ MUST_KNOW threshold bypass, cron endpoint, and graceful degradation.
 All external calls mocked — no network access. Each test fully independent.
 
 Updated for batch-score-tournament flow in run():
-  fetch_all_sources → _filter_by_date → content extraction →
+  fetch_all_sources → date/prep filter → content extraction →
   run_pass1_batch → threshold filter → select_top_articles →
   run_pass2 per article → build result dict
 """
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 import httpx
 import pytest
 
-from app.services.idsa_scraper import IDSAScraper
+from app.services.idsa_scraper import IDSAScraper, _HEADERS
 
 
 # ---------------------------------------------------------------------------
@@ -369,3 +369,33 @@ class TestPDFSkip:
         urls = [a["source_url"] for a in articles]
         # No PDF URL in results
         assert not any(u.lower().endswith(".pdf") for u in urls)
+
+
+# ---------------------------------------------------------------------------
+# Shared client: injected client is used and error statuses still raise
+# ---------------------------------------------------------------------------
+
+
+class TestSharedClient:
+    """The injected client is used with the module headers."""
+
+    async def test_injected_client_used_for_requests(self):
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=_make_mock_response(SAMPLE_LISTING_HTML))
+        scraper = IDSAScraper(client=client)
+
+        await scraper._http_get(IDSAScraper.LISTING_URL)
+
+        client.get.assert_awaited_once()
+        assert client.get.call_args[0][0] == IDSAScraper.LISTING_URL
+        assert client.get.call_args[1]["headers"] == _HEADERS
+
+    async def test_injected_client_error_status_raises(self):
+        """raise_for_status runs on the shared-client path too."""
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=_make_mock_response("", status_code=500))
+        scraper = IDSAScraper(client=client)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await scraper._http_get(IDSAScraper.LISTING_URL)
+        assert await scraper.fetch_articles() == []
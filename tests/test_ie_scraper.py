@@ -806,3 +806,28 @@ class TestMetadataOnly:
                 "Scraper should NOT extract article body content"
             )
             assert "body" not in article, "Scraper should NOT extract article body"
+
+
+# ============================================================================
+# TESTS: Shared HTTP client
+# ============================================================================
+
+
+class TestSharedClient:
+    """Verify an injected client is used instead of a per-request one."""
+
+    @pytest.mark.asyncio
+    async def test_injected_client_used_without_redirects(self):
+        client = MagicMock()
+        client.get = AsyncMock(return_value=_make_mock_response(EXPLAINED_SECTION_HTML))
+        scraper = IndianExpressScraper(client=client)
+
+        with patch("app.services.ie_scraper.httpx.AsyncClient") as mock_client_cls:
+            articles = await scraper.scrape_section("explained")
+
+        mock_client_cls.assert_not_called()
+        client.get.assert_awaited_once()
+        assert client.get.call_args[0][0] == scraper.SECTIONS["explained"]
+        assert "User-Agent" in client.get.call_args[1]["headers"]
+        assert client.get.call_args[1]["follow_redirects"] is False
+        assert len(articles) > 0
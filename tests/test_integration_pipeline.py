@@ -7,7 +7,7 @@ Goal: catch wiring bugs between stages (wrong keys, wrong counts, missing
 result keys, DB save not triggered).
 
 Updated for batch-score-tournament flow in run():
-  fetch_all_sources → _filter_by_date → content extraction →
+  fetch_all_sources → date/prep filter → content extraction →
   run_pass1_batch → threshold filter → select_top_articles →
   run_pass2 per article → build result dict
 """
@@ -102,7 +102,6 @@ def _patch_pipeline_internals(
     """Context manager that patches all internals of run() for integration tests.
 
     - fetch_all_sources → returns raw_articles
-    - _filter_by_date → pass-through (dynamic dates already handle this)
     - KnowledgeCardPipeline → mock run_pass1_batch, run_pass2, _is_must_know, etc.
     - ArticleSelector → mock select_top_articles (pass-through by default)
     - UniversalContentExtractor → optional mock
@@ -330,3 +330,17 @@ class TestStandardizedFormat:
             )
             assert article["source_site"] == "mea"
             assert article["section"] == "press-releases"
+
+
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_injected_client_used_for_requests(self):
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=MagicMock(status_code=200, text=""))
+        scraper = MEAScraper(client=client)
+
+        await scraper._http_get(MEAScraper.LISTING_URL)
+
+        client.get.assert_awaited_once()
+        assert client.get.call_args[0][0] == MEAScraper.LISTING_URL
+        assert "User-Agent" in client.get.call_args[1]["headers"]
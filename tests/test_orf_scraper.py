@@ -409,3 +409,20 @@ class TestMaxPagesLimit:
             await scraper.fetch_articles(hours=9999)
 
         assert call_count <= ORFScraper.MAX_PAGES
+
+
+class TestSharedClient:
+    """The injected client is used for page fetches."""
+
+    async def test_injected_client_used_for_requests(self):
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=_make_mock_response(""))
+        scraper = ORFScraper(client=client)
+
+        with patch("app.services.orf_scraper.httpx.AsyncClient") as mock_client_cls:
+            await scraper._http_get(ORFScraper.BASE_URL)
+
+        mock_client_cls.assert_not_called()
+        client.get.assert_awaited_once()
+        assert client.get.call_args[0][0] == ORFScraper.BASE_URL
+        assert "User-Agent" in client.get.call_args[1]["headers"]
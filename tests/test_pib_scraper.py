@@ -412,4 +412,29 @@ class TestScrapeReleases:
 
         assert form_data["ctl00$ContentPlaceHolder1$ddlday"] == str(today.day)
         assert form_data["ctl00$ContentPlaceHolder1$ddlMonth"] == str(today.month)
-        assert form_data["ctl00$ContentPlaceHolder1$ddlYear"] == str(today.year)
\ No newline at end of file
+        assert form_data["ctl00$ContentPlaceHolder1$ddlYear"] == str(today.year)
+
+class TestSharedClient:
+    """Tests for the injected shared httpx client."""
+
+    @pytest.mark.asyncio
+    async def test_injected_client_used_for_get_and_post(self):
+        """The ViewState GET and the date POST should both go through the client."""
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=_make_mock_response(SAMPLE_INITIAL_PAGE))
+        client.post = AsyncMock(return_value=_make_mock_response(SAMPLE_RESULTS_PAGE))
+        scraper = PIBScraper(client=client)
+
+        with patch("app.services.pib_scraper.httpx.AsyncClient") as mock_client_cls:
+            articles = await scraper.scrape_releases(
+                target_date=date(2026, 2, 22),
+                filter_upsc_relevant=False,
+            )
+
+        mock_client_cls.assert_not_called()
+        client.get.assert_awaited_once()
+        client.post.assert_awaited_once()
+        assert "User-Agent" in client.get.call_args[1]["headers"]
+        assert "User-Agent" in client.post.call_args[1]["headers"]
+        assert client.post.call_args[1]["data"]["__VIEWSTATE"]
+        assert len(articles) == 3
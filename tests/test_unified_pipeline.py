@@ -409,6 +409,80 @@ class TestFetchAllSources:
         urls = [a.get("url", "").lower() for a in result]
         assert len(urls) == len(set(urls)), "Duplicate URLs found"
 
+    @pytest.mark.asyncio
+    async def test_dedup_winner_follows_source_order(self):
+        """A duplicate URL keeps the earlier source's copy even if it finishes last."""
+
+        async def _slow_hindu():
+            await asyncio.sleep(0.05)
+            return _hindu_articles()
+
+        self.mock_rss.fetch_all_sources_parallel = AsyncMock(side_effect=_slow_hindu)
+        self.mock_ie.scrape_all_sections = AsyncMock(
+            return_value=[
+                {
+                    "title": "Duplicate",
+                    "url": "https://thehindu.com/editorial/article1",  # same as Hindu #1
+                    "published_date": _RECENT_DATE_STR,
+                    "source_site": "indianexpress",
+                },
+            ]
+        )
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        streamed: list[str] = []
+        result = await UnifiedPipeline().fetch_all_sources(
+            on_batch=lambda batch: streamed.extend(a["title"] for a in batch)
+        )
+        titles = [a["title"] for a in result]
+        assert titles[:2] == ["Hindu Article 1", "Hindu Article 2"]
+        assert "Duplicate" not in titles
+        # The faster duplicate was still streamed, and Hindu #1 not re-streamed
+        assert "Duplicate" in streamed
+        assert "Hindu Article 1" not in streamed
+
+    @pytest.mark.asyncio
+    async def test_article_without_url_warned_once(self, caplog):
+        """A URL-less article is warned about once, not again by the streaming pass."""
+        self.mock_pib.scrape_releases = AsyncMock(
+            return_value=[{"title": "No URL Release", "published_date": _RECENT_DATE_STR}]
+        )
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        with caplog.at_level("WARNING", logger="app.services.unified_pipeline"):
+            result = await UnifiedPipeline().fetch_all_sources(on_batch=lambda batch: None)
+
+        warnings = [
+            r for r in caplog.records
+            if r.getMessage() == "Skipping article with no URL: 'No URL Release'"
+        ]
+        assert len(warnings) == 1
+        assert all(a["title"] != "No URL Release" for a in result)
+
+    @pytest.mark.asyncio
+    async def test_pending_fetches_cancelled_before_clients_close(self):
+        """If on_batch raises, still-running fetches are cancelled before cleanup."""
+        cancelled = asyncio.Event()
+
+        async def _hanging_hindu():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        self.mock_rss.fetch_all_sources_parallel = AsyncMock(side_effect=_hanging_hindu)
+
+        def _on_batch(batch):
+            raise RuntimeError("consumer failed")
+
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        with pytest.raises(RuntimeError, match="consumer failed"):
+            await UnifiedPipeline().fetch_all_sources(on_batch=_on_batch)
+        assert cancelled.is_set()
+        self.w3["session"].close.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_source_failure_does_not_crash(self):
         """If one source raises, others still returned."""
@@ -461,6 +535,25 @@ class TestEnrichArticles:
             await p.enrich_articles(articles)
             mock_kcp.process_article.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_pipeline_built_once_per_instance(self):
+        """KnowledgeCardPipeline is constructed lazily and reused across calls."""
+        with patch(
+            "app.services.unified_pipeline.KnowledgeCardPipeline"
+        ) as mock_kcp_cls:
+            mock_kcp = MagicMock()
+            mock_kcp.process_article = AsyncMock(return_value=_enriched_article())
+            mock_kcp_cls.return_value = mock_kcp
+
+            from app.services.unified_pipeline import UnifiedPipeline
+
+            p = UnifiedPipeline()
+            mock_kcp_cls.assert_not_called()
+            articles = [{"title": "A", "content": "body", "url": "http://a.com"}]
+            await p.enrich_articles(articles)
+            await p.enrich_articles(articles)
+            assert mock_kcp_cls.call_count == 1
+
     @pytest.mark.asyncio
     async def test_filters_none_results(self):
         """Articles where process_article returns None are excluded."""
@@ -524,6 +617,39 @@ class TestEnrichArticles:
         result = await UnifiedPipeline().enrich_articles([])
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_up_to_limit_and_keeps_order(self):
+        """Articles are enriched concurrently, capped at `concurrency`, in input order."""
+        in_flight = 0
+        peak = 0
+
+        async def process(article):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if article["title"] == "boom":
+                raise Exception("LLM timeout")
+            return {"title": article["title"]}
+
+        with patch(
+            "app.services.unified_pipeline.KnowledgeCardPipeline"
+        ) as mock_kcp_cls:
+            mock_kcp = MagicMock()
+            mock_kcp.process_article = AsyncMock(side_effect=process)
+            mock_kcp_cls.return_value = mock_kcp
+
+            from app.services.unified_pipeline import UnifiedPipeline
+
+            titles = [f"A{i}" for i in range(6)] + ["boom"]
+            result = await UnifiedPipeline().enrich_articles(
+                [{"title": t} for t in titles], concurrency=3
+            )
+
+        assert peak == 3
+        assert [r["title"] for r in result] == titles[:-1]
+
 
 # ---------------------------------------------------------------------------
 # 13-20  run (integration of fetch + extract + batch-score + select + pass2)
@@ -722,6 +848,74 @@ class TestRun:
         # Articles with content: Hindu(2) + hindu_pw(1) + ie_pw(1) + mea(1) + orf(1) + idsa(1) = 7
         assert result["total_enriched"] >= 7
 
+    @pytest.mark.asyncio
+    async def test_content_extraction_runs_concurrently(self):
+        """Extractions overlap instead of running one URL at a time."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_extract(url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(content="<p>Extracted body</p>", summary="")
+
+        self.mock_ext.extract_content = AsyncMock(side_effect=slow_extract)
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        await UnifiedPipeline().run()
+        assert self.mock_ext.extract_content.call_count >= 3
+        assert peak > 1
+
+    @pytest.mark.asyncio
+    async def test_extraction_starts_before_slow_source_finishes(self):
+        """Fast sources' articles are extracted while a slow scraper is still running."""
+        events = []
+
+        async def slow_editorials():
+            await asyncio.sleep(0.05)
+            events.append("slow source done")
+            return []
+
+        async def extract(url):
+            events.append("extract")
+            return MagicMock(content="<p>Extracted body</p>", summary="")
+
+        self.w3["hindu_pw"].scrape_editorials = AsyncMock(side_effect=slow_editorials)
+        self.mock_ext.extract_content = AsyncMock(side_effect=extract)
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        await UnifiedPipeline().run()
+        assert events.index("extract") < events.index("slow source done")
+
+    @pytest.mark.asyncio
+    async def test_streamed_article_date_checked_once(self, caplog):
+        """An old article rejected while streaming is not re-checked in Step 2."""
+        old_date = (datetime.now(timezone.utc) - timedelta(days=5)).isoformat()
+        self.mock_pib.scrape_releases = AsyncMock(
+            return_value=[
+                {
+                    "title": "Stale PIB Release",
+                    "url": "https://pib.gov.in/stale",
+                    "published_date": old_date,
+                    "source_site": "pib",
+                }
+            ]
+        )
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        with caplog.at_level("DEBUG", logger="app.services.unified_pipeline"):
+            result = await UnifiedPipeline().run()
+
+        date_logs = [
+            r for r in caplog.records
+            if r.getMessage().startswith("Date-filtered: 'Stale PIB Release'")
+        ]
+        assert len(date_logs) == 1
+        assert all(a["title"] != "Stale PIB Release" for a in result["articles"])
+
     @pytest.mark.asyncio
     async def test_process_article_exception_does_not_crash(self):
         """If run_pass2 raises for one article, others still processed."""
@@ -776,6 +970,27 @@ class TestRun:
         await UnifiedPipeline().run()
         self.mock_kcp.run_pass1_batch.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_stale_and_prep_articles_filtered(self):
+        """Articles older than 36h and UPSC prep round-ups never reach scoring."""
+        stale = (datetime.now(timezone.utc) - timedelta(hours=72)).isoformat()
+        self.mock_ie.scrape_all_sections = AsyncMock(
+            return_value=[
+                {"title": "Old News", "url": "https://indianexpress.com/old",
+                 "published_date": stale, "source_site": "indianexpress"},
+                {"title": "UPSC Key: Daily round-up", "url": "https://indianexpress.com/key",
+                 "published_date": _RECENT_DATE_STR, "source_site": "indianexpress"},
+            ]
+        )
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        result = await UnifiedPipeline().run()
+        scored = self.mock_kcp.run_pass1_batch.call_args[0][0]
+        titles = {a["title"] for a in scored}
+        assert "Old News" not in titles
+        assert "UPSC Key: Daily round-up" not in titles
+        assert result["total_fetched"] == 11
+
     @pytest.mark.asyncio
     async def test_run_pass2_only_on_selected(self):
         from app.services.unified_pipeline import UnifiedPipeline
@@ -1099,19 +1314,80 @@ class TestPrepareKnowledgeCardForDatabase:
 
 
 class TestSaveArticles:
+    @pytest.mark.asyncio
+    async def test_bulk_upserts_all_rows_in_one_call(self):
+        """save_articles sends every row in a single bulk upsert."""
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        mock_db = AsyncMock()
+        mock_db.upsert_current_affairs_bulk = AsyncMock(
+            return_value={"success": True, "data": [{}, {}], "count": 2}
+        )
+
+        articles = [
+            {"title": "A", "url": "http://a.com", "content": "<p>A</p>", "priority_triage": "must_know"},
+            {"title": "B", "url": "http://b.com", "content": "<p>B</p>", "priority_triage": "should_know"},
+        ]
+
+        result = await UnifiedPipeline().save_articles(articles, mock_db)
+
+        mock_db.upsert_current_affairs_bulk.assert_awaited_once()
+        rows = mock_db.upsert_current_affairs_bulk.call_args[0][0]
+        assert [r["source_url"] for r in rows] == ["http://a.com", "http://b.com"]
+        assert mock_db.upsert_current_affairs_bulk.call_args[1]["match_field"] == "source_url"
+        mock_db.upsert_current_affair.assert_not_called()
+        assert result == {"saved": 2, "skipped": 0, "errors": 0}
+
+    @pytest.mark.asyncio
+    async def test_rows_prepared_off_event_loop(self):
+        """DB rows are built in a worker thread, not on the event-loop thread."""
+        import threading
+
+        from app.services import unified_pipeline
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        loop_thread = threading.get_ident()
+        prep_threads = []
+        real_prepare = unified_pipeline.prepare_knowledge_card_for_database
+
+        def recording_prepare(article):
+            prep_threads.append(threading.get_ident())
+            return real_prepare(article)
+
+        mock_db = AsyncMock()
+        mock_db.upsert_current_affairs_bulk = AsyncMock(
+            return_value={"success": True, "data": [], "count": 2}
+        )
+        articles = [
+            {"title": "A", "url": "http://a.com", "content": "<p>A</p>"},
+            {"title": "B", "url": "http://b.com", "content": "<p>B</p>"},
+        ]
+
+        with patch(
+            "app.services.unified_pipeline.prepare_knowledge_card_for_database",
+            side_effect=recording_prepare,
+        ):
+            await UnifiedPipeline().save_articles(articles, mock_db)
+
+        assert len(prep_threads) == 2
+        assert loop_thread not in prep_threads
+
     @pytest.mark.asyncio
     async def test_calls_upsert_and_returns_correct_counts(self):
-        """save_articles upserts each article and reports saved count."""
+        """When the bulk upsert fails, save_articles upserts each article."""
         from app.services.unified_pipeline import UnifiedPipeline
 
         mock_db = AsyncMock()
+        mock_db.upsert_current_affairs_bulk = AsyncMock(
+            return_value={"success": False, "error": "payload too large"}
+        )
         mock_db.upsert_current_affair = AsyncMock(
             return_value={"success": True, "data": {}, "message": "ok"}
         )
 
         articles = [
-            {"title": "A", "url": "http://a.com", "priority_triage": "must_know"},
-            {"title": "B", "url": "http://b.com", "priority_triage": "should_know"},
+            {"title": "A", "url": "http://a.com", "content": "<p>A</p>", "priority_triage": "must_know"},
+            {"title": "B", "url": "http://b.com", "content": "<p>B</p>", "priority_triage": "should_know"},
         ]
 
         pipeline = UnifiedPipeline()
@@ -1127,6 +1403,9 @@ class TestSaveArticles:
         from app.services.unified_pipeline import UnifiedPipeline
 
         mock_db = AsyncMock()
+        mock_db.upsert_current_affairs_bulk = AsyncMock(
+            side_effect=Exception("connection reset")
+        )
         mock_db.upsert_current_affair = AsyncMock(
             side_effect=[
                 {"success": True, "data": {}, "message": "ok"},
@@ -1135,8 +1414,8 @@ class TestSaveArticles:
         )
 
         articles = [
-            {"title": "Good", "url": "http://good.com", "priority_triage": "must_know"},
-            {"title": "Bad", "url": "http://bad.com", "priority_triage": "should_know"},
+            {"title": "Good", "url": "http://good.com", "content": "<p>G</p>", "priority_triage": "must_know"},
+            {"title": "Bad", "url": "http://bad.com", "content": "<p>B</p>", "priority_triage": "should_know"},
         ]
 
         pipeline = UnifiedPipeline()
@@ -1145,6 +1424,28 @@ class TestSaveArticles:
         assert result["saved"] == 1
         assert result["errors"] == 1
 
+    @pytest.mark.asyncio
+    async def test_empty_content_is_skipped_not_saved(self):
+        """Articles with blank content are counted as skipped and never sent to the DB."""
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        mock_db = AsyncMock()
+        mock_db.upsert_current_affairs_bulk = AsyncMock(
+            return_value={"success": True, "data": [{}], "count": 1}
+        )
+
+        articles = [
+            {"title": "Full", "url": "http://full.com", "content": "<p>Body</p>"},
+            {"title": "Blank", "url": "http://blank.com", "content": "   "},
+            {"title": "Missing", "url": "http://missing.com"},
+        ]
+
+        result = await UnifiedPipeline().save_articles(articles, mock_db)
+
+        rows = mock_db.upsert_current_affairs_bulk.call_args[0][0]
+        assert [r["source_url"] for r in rows] == ["http://full.com"]
+        assert result == {"saved": 1, "skipped": 2, "errors": 0}
+
 
 class TestRunSaveToDb:
     @pytest.fixture(autouse=True)
@@ -1308,6 +1609,33 @@ class TestRunSaveToDb:
         self.mock_db_cls.assert_not_called()
         assert "db_save" not in result
 
+    @pytest.mark.asyncio
+    async def test_enhanced_content_is_enriched_and_saved(self):
+        """Enhancement rewrites content; the article is still enriched and saved
+        with the hash of the enhanced body, not the extracted one."""
+        from app.services.unified_pipeline import UnifiedPipeline, _content_hash
+
+        response = MagicMock(
+            success=True,
+            data={
+                "enhanced_title": "Enhanced Title",
+                "enhanced_content": "<p>Enhanced body.</p>",
+                "brief_summary": "Enhanced summary.",
+            },
+        )
+        with patch(
+            "app.services.unified_pipeline.llm_service.process_request",
+            AsyncMock(return_value=response),
+        ):
+            result = await UnifiedPipeline().run(save_to_db=True)
+
+        assert result["total_enriched"] == 1
+        assert result["db_save"]["saved"] == 1
+        db_row = self.mock_db.upsert_current_affair.call_args.args[0]
+        assert db_row["content"] == "<p>Enhanced body.</p>"
+        assert db_row["content_hash"] == _content_hash("<p>Enhanced body.</p>")
+        assert db_row["content_hash"] != _content_hash("Test content body.")
+
 
 # ---------------------------------------------------------------------------
 # 30-35  Wave 3 scraper-specific tests
@@ -1436,8 +1764,19 @@ class TestWave3Scrapers:
         from app.services.unified_pipeline import UnifiedPipeline
 
         await UnifiedPipeline().fetch_all_sources()
-        # Session is created twice (hindu_pw + ie_pw), cleanup called for each
-        assert self.w3["session"].close.call_count >= 2
+        # One session is shared by hindu_pw + ie_pw and closed once
+        assert self.w3["session"].close.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_playwright_session_shared_and_closed_on_failure(self):
+        """Both playwright scrapers share one session, closed even if they fail."""
+        self.w3["hindu_pw"].scrape_editorials = AsyncMock(side_effect=Exception("fail"))
+        self.w3["ie_pw"].scrape_editorials = AsyncMock(side_effect=Exception("fail"))
+        from app.services.unified_pipeline import UnifiedPipeline
+
+        await UnifiedPipeline().fetch_all_sources()
+        assert self.mock_session_cls.call_count == 1
+        self.w3["session"].close.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_wave3_failure_does_not_affect_others(self):
@@ -1465,3 +1804,129 @@ class TestWave3Scrapers:
             assert expected_site in source_sites, (
                 f"Missing source_site '{expected_site}' in results"
             )
+
+
+# ---------------------------------------------------------------------------
+# Module-level helpers
+# ---------------------------------------------------------------------------
+
+
+class TestDeriveSection:
+    @pytest.mark.parametrize(
+        "source_name, expected",
+        [
+            ("The Hindu - Editorial", "editorial"),
+            ("The Hindu - Op-Ed", "opinion"),
+            # Keywords are checked in dict order, so "national" matches first
+            ("The Hindu - International", "national"),
+            ("THE HINDU - SCIENCE", "science"),
+            ("The Hindu - Lead", "general"),
+            ("", "general"),
+        ],
+    )
+    def test_maps_source_name_to_section(self, source_name, expected):
+        from app.services.unified_pipeline import _derive_section
+
+        assert _derive_section(source_name) == expected
+
+
+class TestContentHash:
+    def test_hash_matches_utf8_blake2b_of_content(self):
+        import hashlib
+
+        from app.services.unified_pipeline import prepare_knowledge_card_for_database
+
+        db_row = prepare_knowledge_card_for_database({"content": "नमस्ते <p>body</p>"})
+        expected = hashlib.blake2b(
+            "नमस्ते <p>body</p>".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        assert db_row["content_hash"] == expected
+
+    def test_lone_surrogate_does_not_raise(self):
+        from app.services.unified_pipeline import prepare_knowledge_card_for_database
+
+        db_row = prepare_knowledge_card_for_database({"content": "broken \ud800 text"})
+        assert len(db_row["content_hash"]) == 32
+
+
+class TestDateHelpers:
+    def test_to_iso_str_dispatch(self):
+        from app.services.unified_pipeline import _to_iso_str
+
+        dt = datetime(2026, 2, 25, 10, 30, tzinfo=timezone.utc)
+        assert _to_iso_str(dt) == dt.isoformat()
+        assert _to_iso_str("2026-02-25T10:30:00Z") == "2026-02-25T10:30:00Z"
+        assert _to_iso_str(None) == ""
+        assert _to_iso_str(12345) == ""
+
+    def test_parse_date_accepts_datetime_and_strings(self):
+        from app.services.unified_pipeline import _parse_date
+
+        assert _parse_date(datetime(2026, 2, 25, 23, 59)) == "2026-02-25"
+        assert _parse_date("2026-02-25T10:30:00Z") == "2026-02-25"
+        assert _parse_date("  2026-02-25  ") == "2026-02-25"
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        assert _parse_date(None) == today
+        assert _parse_date("not a date") == today
+
+    def test_parse_date_str_caches_and_reports_failure(self):
+        from app.services.unified_pipeline import _parse_date_str
+
+        _parse_date_str.cache_clear()
+        assert _parse_date_str("Tue, 24 Feb 2026") == ""
+        assert _parse_date_str(" 2026-02-25T10:30:00+05:30") == "2026-02-25"
+        assert _parse_date_str(" 2026-02-25T10:30:00+05:30") == "2026-02-25"
+        assert _parse_date_str.cache_info().hits == 1
+
+    def test_today_str_cached_per_hour_bucket(self):
+        from app.services.unified_pipeline import _today_str
+
+        _today_str.cache_clear()
+        with patch("app.services.unified_pipeline.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime(2026, 2, 25, 10, tzinfo=timezone.utc)
+            assert _today_str(100) == "2026-02-25"
+            assert _today_str(100) == "2026-02-25"
+            assert mock_dt.now.call_count == 1
+        _today_str.cache_clear()
+
+
+class TestDeduplicate:
+    def test_tracking_params_and_trailing_slash_ignored(self):
+        from app.services.unified_pipeline import _deduplicate
+
+        articles = [
+            {"title": "A", "url": "https://thehindu.com/news/a/?utm_source=rss"},
+            {"title": "B", "url": "http://TheHindu.com/news/a?utm_source=twitter&fbclid=x"},
+            {"title": "C", "url": "https://thehindu.com/news/a#comments"},
+        ]
+        assert [a["title"] for a in _deduplicate(articles)] == ["A"]
+
+    def test_identifying_query_params_kept(self):
+        from app.services.unified_pipeline import _deduplicate
+
+        articles = [
+            {"title": "A", "url": "https://pib.gov.in/PressReleasePage.aspx?PRID=1"},
+            {"title": "B", "url": "https://pib.gov.in/PressReleasePage.aspx?PRID=2"},
+            {"title": "C", "url": "https://pib.gov.in/PressReleasePage.aspx?PRID=1&utm_medium=x"},
+        ]
+        assert [a["title"] for a in _deduplicate(articles)] == ["A", "B"]
+
+    def test_articles_without_url_skipped(self):
+        from app.services.unified_pipeline import _deduplicate
+
+        assert _deduplicate([{"title": "No URL"}, {"title": "Empty", "url": ""}]) == []
+
+    def test_shared_seen_dedups_across_batches(self):
+        from app.services.unified_pipeline import _deduplicate
+
+        seen: set[str] = set()
+        first = _deduplicate([{"title": "A", "url": "https://x.com/a"}], seen)
+        second = _deduplicate(
+            [
+                {"title": "A again", "url": "https://x.com/a/"},
+                {"title": "B", "url": "https://x.com/b"},
+            ],
+            seen,
+        )
+        assert [a["title"] for a in first] == ["A"]
+        assert [a["title"] for a in second] == ["B"]